@@ -6,13 +6,20 @@ and `rgns` (region), paginates via `p` parameter, and outputs structured dataset
 
 # --- Imports ---
 import asyncio
+import functools
+import hashlib
 import random
 import urllib.parse
 import re
 import json
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, Sequence, Tuple
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+try:
+    from orjson import loads as json_loads  # C decoder, faster on large JSON-LD payloads
+except ImportError:
+    from json import loads as json_loads
+from bs4 import BeautifulSoup, NavigableString, Tag
 from playwright.async_api import async_playwright, Page
 from apify import Actor
 
@@ -23,29 +30,257 @@ MAX_BACKOFF_DELAY = 60.0
 FETCH_MAX_BACKOFF_DELAY = 30.0  # Shorter delay for page fetches
 DEFAULT_MAX_PAGES = 1
 DEFAULT_MAX_JOBS = 0
+DEFAULT_PAGE_CONCURRENCY = 2
 CLOUDFLARE_CHALLENGE_TIMEOUT = 45000  # 45 seconds for CF challenge
 TURNSTILE_CHALLENGE_TIMEOUT = 40000  # 40 seconds for Turnstile
 DETAIL_FETCH_TIMEOUT = 45000
 DETAIL_MAX_ATTEMPTS = 3
 DETAIL_CONCURRENCY = 2
+HTTP_FETCH_TIMEOUT = 20000  # Plain HTTP search page fetch
+HTTP_FETCH_MAX_MISSES = 3  # Consecutive plain HTTP misses before search pages go browser-only
+LISTING_WAIT_TIMEOUT = 3000  # Listings are server-rendered; empty result pages never match
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet', 'texttrack'})  # Not needed for HTML scraping
+JOB_KEY_PARAMS = frozenset({'ckey', 'jkey'})  # Stable job id on /redirect URLs; other params are per-session
+
+# --- Fingerprint Pools ---
+# Module-level tuples so per-fetch and per-context sampling allocates nothing
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
+)
+CONNECTION_TYPES = (
+    ('fast_4g', 20, 50),    # 20-50ms
+    ('slow_4g', 50, 150),   # 50-150ms
+    ('fast_3g', 100, 300),  # 100-300ms
+    ('slow_3g', 200, 500),  # 200-500ms
+)
+FIRST_PAGE_REFERERS = (
+    None,  # Direct access
+    'https://www.google.com/search?q=jobs',  # Google search
+    'https://www.bing.com/search?q=job+search',  # Bing search
+    'https://duckduckgo.com/?q=employment',  # DuckDuckGo
+    'https://www.linkedin.com/jobs',  # LinkedIn jobs
+    'https://indeed.com/',  # Indeed
+)
+CONTEXT_LOCALES = ('en-US', 'en-GB', 'en-CA')
+CONTEXT_TIMEZONES = ('America/New_York', 'America/Los_Angeles', 'Europe/London', 'Asia/Tokyo')
+DEVICE_SCALE_FACTORS = (1, 1.25, 1.5)
+
+# Additional headers to mimic a real browser (no DNT - it's a bot signature)
+BROWSER_NAV_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+# Streamlined stealth script - avoid aggressive anti-detection
+STEALTH_INIT_SCRIPT = """
+    // Remove webdriver property (essential)
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Mock chrome object (essential for Chrome detection)
+    window.chrome = {
+        runtime: {}
+    };
+
+    // Mock plugins (minimal, real browsers don't expose full list)
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3]  // Just return array with items
+    });
+
+    // Remove obvious bot signatures
+    delete window.callPhantom;
+    delete window._phantom;
+    delete window.__nightmare;
+    delete window._seleniumRunner;
+"""
+
+# --- Compiled Patterns ---
+JOB_HREF_RE = re.compile(r'/redirect|/job/|/jdp/')  # Job detail or redirect links
+# Server-rendered job cards; a bare /job/ or /redirect link can come from a footer or block page
+LISTING_MARKER_RE = re.compile(r'\bjob_card_link\b|href="[^"]*/jdp/')
+LD_JSON_SCRIPT_RE = re.compile(r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.S | re.I)
+CHROME_VERSION_RE = re.compile(r'Chrome/(\d+)\.(\d+)\.(\d+)\.(\d+)')
+NAV_TITLE_RE = re.compile(r'\b(?:next|prev(?:ious)?|all jobs|home|about)\b', re.I)  # Pagination/site links, not jobs
+# Ad/analytics hosts; their scripts and beacons never affect the listings
+BLOCKED_HOST_RE = re.compile(
+    r'^https?://(?:[^/?#]*\.)?(?:doubleclick\.net|googlesyndication\.com|googleadservices\.com|'
+    r'google-analytics\.com|googletagmanager\.com|facebook\.net|hotjar\.com|criteo\.com|adnxs\.com)(?::\d+)?(?:[/?#]|$)',
+    re.I,
+)
+
+# --- Compiled Selectors ---
+
+def _compile_selectors(selectors: Sequence[str]) -> Tuple[Tuple[str, sv.SoupSieve], ...]:
+    """Compile CSS selectors once at import, dropping any SoupSieve cannot parse."""
+    compiled = []
+    for css in selectors:
+        try:
+            compiled.append((css, sv.compile(css)))
+        except sv.SelectorSyntaxError:
+            continue
+    return tuple(compiled)
+
+
+# Job block containers on search pages - ordered by reliability
+BLOCK_SELECTORS = _compile_selectors([
+    'article',  # Most common container
+    'div[class*="_75cac"]',  # Jooble class pattern
+    'div[data-test-name="job-item"]',
+    'div.job-item',
+])
+# All block strategies merged so the page is walked once; candidates are then
+# bucketed back to the strategies in priority order
+BLOCK_SELECTOR_UNION = sv.compile(', '.join(css for css, _ in BLOCK_SELECTORS))
+
+# Job links on search pages - ordered by reliability
+LINK_SELECTORS = _compile_selectors([
+    'a[href*="/jdp/"]',       # PRIMARY: Job detail pages
+    'a[href*="/job/"]',       # SECONDARY: Alternate detail pattern
+    'a[href*="/redirect?"]',  # TERTIARY: External redirect (fallback only)
+    'a.job_card_link',        # FALLBACK: CSS class based
+])
+
+# Link and block strategies merged so a search page is walked once for both extractors
+LINK_SELECTOR_UNION = sv.compile(', '.join(css for css, _ in LINK_SELECTORS))
+PAGE_CANDIDATE_UNION = sv.compile(', '.join(css for css, _ in LINK_SELECTORS + BLOCK_SELECTORS))
+
+# Any job or redirect link; a block without one is not a job card
+JOB_LINK_SELECTOR = sv.compile('a[href*="/redirect"], a[href*="/job/"], a[href*="/jdp/"]')
+
+# Detail page link inside a card, and title fallback when link text is empty
+DETAIL_LINK_SELECTOR = sv.compile('a[href*="/jdp/"], a[href*="/job/"]')
+LINK_TITLE_SELECTOR = sv.compile('a[href*="/jdp/"], a[href*="/job/"], h2, h3')
+
+# Clearly-marked metadata elements inside a link's container
+LINK_COMPANY_SELECTOR = sv.compile('span[class*="company" i], div[class*="company" i], span[class*="employer" i], div[class*="employer" i]')
+LINK_LOCATION_SELECTOR = sv.compile('span[class*="location" i], div[class*="location" i], span[class*="city" i], div[class*="city" i]')
+LINK_SALARY_SELECTOR = sv.compile('span[class*="salary" i], div[class*="salary" i], span[class*="wage" i], div[class*="wage" i]')
+LINK_DATE_SELECTOR = sv.compile('time, span[class*="posted" i], span[class*="date" i], div[class*="date" i]')
+LINK_JOB_TYPE_SELECTOR = sv.compile('span[class*="type" i], span[class*="employment" i], span[class*="schedule" i]')
+LINK_DESCRIPTION_SELECTOR = sv.compile('p[class*="description" i], div[class*="description" i], div[class*="snippet" i], div[class*="summary" i]')
+LINK_FIELD_SELECTORS = {
+    'detail_link': DETAIL_LINK_SELECTOR,
+    'company': LINK_COMPANY_SELECTOR,
+    'location': LINK_LOCATION_SELECTOR,
+    'salary': LINK_SALARY_SELECTOR,
+    'date_posted': LINK_DATE_SELECTOR,
+    'job_type': LINK_JOB_TYPE_SELECTOR,
+    'description': LINK_DESCRIPTION_SELECTOR,
+}
+LINK_FIELD_UNION = sv.compile(', '.join(selector.pattern for selector in LINK_FIELD_SELECTORS.values()))
+
+# Per-field selectors used inside a job block
+BLOCK_COMPANY_SELECTORS = _compile_selectors([
+    'span[class*="company" i]',
+    'div[class*="company" i]',
+    'a[class*="company" i]',
+    '[data-company]',
+])
+BLOCK_LOCATION_SELECTORS = _compile_selectors([
+    'span[class*="location" i]',
+    'div[class*="location" i]',
+    '[class*="city" i]',
+    '[data-location]',
+])
+BLOCK_SALARY_SELECTORS = _compile_selectors([
+    'span[class*="salary" i]',
+    'div[class*="salary" i]',
+    '[class*="wage" i]',
+    '[data-salary]',
+])
+BLOCK_DESCRIPTION_SELECTORS = _compile_selectors([
+    'div[class*="description" i]',
+    'div[class*="snippet" i]',
+    'p[class*="description" i]',
+])
+BLOCK_DATE_SELECTORS = _compile_selectors([
+    'span[class*="date" i]',
+    'time',
+    '[datetime]',
+])
+BLOCK_JOB_TYPE_SELECTORS = _compile_selectors([
+    'span[class*="type" i]',
+    'span[class*="schedule" i]',
+    '[data-type]',
+])
+BLOCK_FIELD_SELECTORS = {
+    'company': BLOCK_COMPANY_SELECTORS,
+    'location': BLOCK_LOCATION_SELECTORS,
+    'salary': BLOCK_SALARY_SELECTORS,
+    'description': BLOCK_DESCRIPTION_SELECTORS,
+    'date_posted': BLOCK_DATE_SELECTORS,
+    'job_type': BLOCK_JOB_TYPE_SELECTORS,
+}
+# Cheap pre-filter: tags matching none of the field selectors are skipped in one call
+BLOCK_FIELD_UNION = sv.compile(', '.join(
+    css for selectors in BLOCK_FIELD_SELECTORS.values() for css, _ in selectors
+))
+
+# Description containers on Jooble detail pages
+DETAIL_DESCRIPTION_SELECTORS = _compile_selectors([
+    '[data-test-name="job-description"]',
+    '[itemprop="description"]',
+    'div[id*="description" i]',
+    'section[id*="description" i]',
+    'article[id*="description" i]',
+    'div[class*="description" i]',
+])
+
+# Supplemental detail-page fields, used when JSON-LD does not provide them
+DETAIL_FIELD_SELECTORS = {
+    'company': _compile_selectors([
+        '[data-test-name="job-company"]',
+        'span[class*="company" i]',
+        'div[class*="company" i]',
+        '[itemprop="hiringOrganization"]',
+    ]),
+    'location': _compile_selectors([
+        '[data-test-name="job-location"]',
+        'span[class*="location" i]',
+        'div[class*="location" i]',
+        '[itemprop="jobLocation"]',
+    ]),
+    'salary': _compile_selectors([
+        '[data-test-name="job-salary"]',
+        'span[class*="salary" i]',
+        'div[class*="salary" i]',
+        '[itemprop="baseSalary"]',
+    ]),
+    'job_type': _compile_selectors([
+        '[data-test-name="job-type"]',
+        'span[class*="employment" i]',
+        'div[class*="employment" i]',
+    ]),
+    'date_posted': _compile_selectors([
+        '[data-test-name="job-date"]',
+        'time[datetime]',
+        'span[class*="posted" i]',
+    ]),
+}
 
 # --- Helper Functions ---
 
 def get_random_user_agent():
     """Return a random realistic user agent with latest Chrome versions."""
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
-    ]
-    return random.choice(user_agents)
+    return random.choice(USER_AGENTS)
 
 
+@functools.lru_cache(maxsize=16)
 def get_client_hints_for_ua(user_agent: str) -> Dict[str, str]:
-    """Generate client hint headers that match the user agent."""
+    """Generate client hint headers that match the user agent (cached; callers must copy, not mutate)."""
     # Extract platform and version from UA
     is_mobile = '"Mobile"' in user_agent
     is_windows = 'Windows NT' in user_agent
@@ -53,12 +288,8 @@ def get_client_hints_for_ua(user_agent: str) -> Dict[str, str]:
     is_linux = 'Linux' in user_agent
 
     # Extract Chrome version
-    version_match = re.search(r'Chrome/(\d+)\.(\d+)\.(\d+)\.(\d+)', user_agent)
-    if version_match:
-        major, minor, build, patch = version_match.groups()
-        chrome_version = f'"{major}.{minor}.{build}.{patch}"'
-    else:
-        chrome_version = '"131.0.0.0"'  # fallback
+    version_match = CHROME_VERSION_RE.search(user_agent)
+    major = version_match.group(1) if version_match else '131'  # fallback
 
     headers = {
         'Sec-CH-UA': f'"Chromium";v={major}, "Google Chrome";v={major}, "Not:A-Brand";v="99"',
@@ -71,25 +302,13 @@ def get_client_hints_for_ua(user_agent: str) -> Dict[str, str]:
 
 def human_like_delay(min_seconds: float = 0.5, max_seconds: float = 3.0) -> float:
     """Generate human-like delay with realistic distribution."""
-    # Use beta distribution for more realistic timing (peaks around 1-2 seconds)
-    import math
-    alpha, beta_param = 2.0, 2.0
-    u = random.random()
-    delay = min_seconds + (max_seconds - min_seconds) * (u ** (1/(alpha+beta_param-1)))
-    return delay
+    # Use beta distribution for more realistic timing (peaks mid-range)
+    return min_seconds + (max_seconds - min_seconds) * random.betavariate(2.0, 2.0)
 
 
 def simulate_network_latency() -> float:
     """Simulate realistic network latency based on connection type."""
-    # Simulate different connection types
-    connection_types = [
-        ('fast_4g', 20, 50),    # 20-50ms
-        ('slow_4g', 50, 150),   # 50-150ms
-        ('fast_3g', 100, 300),  # 100-300ms
-        ('slow_3g', 200, 500),  # 200-500ms
-    ]
-
-    conn_type, min_lat, max_lat = random.choice(connection_types)
+    conn_type, min_lat, max_lat = random.choice(CONNECTION_TYPES)
     # Add jitter and occasional spikes
     base_latency = random.uniform(min_lat, max_lat)
     jitter = random.uniform(-0.2, 0.2) * base_latency
@@ -101,61 +320,82 @@ def simulate_network_latency() -> float:
     return max(10, base_latency + jitter) / 1000  # Convert to seconds
 
 
-def exponential_backoff_with_jitter(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0, jitter_factor: float = 0.1) -> float:
-    """Calculate exponential backoff delay with jitter to avoid thundering herd."""
-    # Exponential backoff: base_delay * (2 ^ (attempt - 1))
-    delay = base_delay * (2 ** (attempt - 1))
-    
-    # Cap at max_delay
-    delay = min(delay, max_delay)
-    
-    # Add jitter (±jitter_factor * delay)
-    jitter = random.uniform(-jitter_factor, jitter_factor) * delay
-    delay += jitter
-    
-    # Ensure minimum delay
-    return max(base_delay, delay)
+def exponential_backoff_with_jitter(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
+    """Calculate exponential backoff with "full jitter" to avoid thundering herd."""
+    # Exponential ceiling: base_delay * (2 ^ (attempt - 1)), capped at max_delay
+    cap = min(base_delay * (2 ** (attempt - 1)), max_delay)
+
+    # Sample uniformly below the ceiling so concurrent retries spread out instead of
+    # landing together (a ±10% band around the ceiling kept them in lockstep)
+    return random.uniform(0, cap)
 
 
-def generate_realistic_referer(current_url: str, page_num: int) -> Optional[str]:
+def generate_realistic_referer(page_num: int, previous_page_url: str) -> Optional[str]:
     """Generate a realistic referer URL for the current request."""
     if page_num == 1:
         # First page - could come from search engine or direct
-        referer_options = [
-            None,  # Direct access
-            'https://www.google.com/search?q=jobs',  # Google search
-            'https://www.bing.com/search?q=job+search',  # Bing search
-            'https://duckduckgo.com/?q=employment',  # DuckDuckGo
-            'https://www.linkedin.com/jobs',  # LinkedIn jobs
-            'https://indeed.com/',  # Indeed
-        ]
-        return random.choice(referer_options)
-    else:
-        # Subsequent pages - likely from previous page in pagination
-        parsed = urllib.parse.urlparse(current_url)
-        query = urllib.parse.parse_qs(parsed.query)
-        
-        # Modify page number to previous page
-        prev_page = page_num - 1
-        query['p'] = [str(prev_page)]
-        
-        prev_query = urllib.parse.urlencode({k: v[0] if isinstance(v, list) else v for k, v in query.items()})
-        prev_url = urllib.parse.urlunparse((parsed.scheme, parsed.netloc, parsed.path, '', prev_query, ''))
-        
-        return prev_url
+        return random.choice(FIRST_PAGE_REFERERS)
+    # Subsequent pages - likely from previous page in pagination
+    return previous_page_url
 
 
 async def simulate_connection_warmup(page: Page) -> None:
     """Simulate connection warmup and DNS resolution."""
-    # Simulate DNS lookup and connection establishment
-    await asyncio.sleep(simulate_network_latency() * 0.5)
+    # DNS lookup and TCP handshake
+    warmup = simulate_network_latency() * 0.5 + simulate_network_latency() * 0.3
 
-    # Simulate TCP handshake
-    await asyncio.sleep(simulate_network_latency() * 0.3)
-
-    # Simulate TLS handshake if HTTPS
+    # TLS handshake if HTTPS
     if random.random() < 0.9:  # 90% of sites are HTTPS
-        await asyncio.sleep(simulate_network_latency() * 0.4)
+        warmup += simulate_network_latency() * 0.4
+
+    # One sleep for the whole warmup; separate sleeps only add event-loop round trips
+    await asyncio.sleep(warmup)
+
+
+# Network and console event handlers for debugging connectivity
+def _on_request_failed(request):
+    try:
+        if is_blocked_request(request):
+            return  # Aborted on purpose by block_heavy_resources
+        Actor.log.warning(f'Request failed: {request.url} - {getattr(request, "failure", None)}')
+    except Exception:
+        pass
+
+
+def _on_console(msg):
+    try:
+        Actor.log.debug(f'Console [{msg.type}]: {msg.text}')
+    except Exception:
+        pass
+
+
+def _on_response(response):
+    try:
+        Actor.log.debug(f'Response: {response.url} -> {response.status}')
+    except Exception:
+        pass
+
+
+def attach_debug_handlers(page: Page, verbose: bool = False) -> None:
+    """Register the shared debug handlers on a page; per-response/console logging only if ``verbose``."""
+    page.on('requestfailed', _on_request_failed)
+    if verbose:
+        # These fire for every subresource of every navigation
+        page.on('console', _on_console)
+        page.on('response', _on_response)
+
+
+def is_blocked_request(request) -> bool:
+    """Return True for requests `block_heavy_resources` aborts: heavy resource types and ad/analytics hosts."""
+    return request.resource_type in BLOCKED_RESOURCE_TYPES or bool(BLOCKED_HOST_RE.match(request.url))
+
+
+async def block_heavy_resources(route) -> None:
+    """Abort subresource requests the scraper never uses; let everything else through."""
+    if is_blocked_request(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 async def create_stealth_context(browser):
@@ -163,14 +403,14 @@ async def create_stealth_context(browser):
     context = await browser.new_context(
         user_agent=get_random_user_agent(),
         viewport={'width': 1920 + random.randint(-100, 100), 'height': 1080 + random.randint(-50, 50)},
-        locale=random.choice(['en-US', 'en-GB', 'en-CA']),
-        timezone_id=random.choice(['America/New_York', 'America/Los_Angeles', 'Europe/London', 'Asia/Tokyo']),
+        locale=random.choice(CONTEXT_LOCALES),
+        timezone_id=random.choice(CONTEXT_TIMEZONES),
         java_script_enabled=True,
         accept_downloads=False,
         bypass_csp=False,  # CHANGED: Don't bypass CSP - can trigger bot detection
         ignore_https_errors=True,
         # Randomize other properties
-        device_scale_factor=random.choice([1, 1.25, 1.5]),
+        device_scale_factor=random.choice(DEVICE_SCALE_FACTORS),
         is_mobile=random.random() < 0.05,  # 5% mobile (reduced from 10%)
         has_touch=random.random() < 0.05,  # 5% touch (reduced from 15%)
         # Enhanced stealth options
@@ -181,61 +421,118 @@ async def create_stealth_context(browser):
         forced_colors=None,  # No forced colors
     )
 
-    # Streamlined stealth script - avoid aggressive anti-detection
-    await context.add_init_script("""
-        // Remove webdriver property (essential)
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined
-        });
-
-        // Mock chrome object (essential for Chrome detection)
-        window.chrome = {
-            runtime: {}
-        };
-
-        // Mock plugins (minimal, real browsers don't expose full list)
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [1, 2, 3]  // Just return array with items
-        });
-
-        // Remove obvious bot signatures
-        delete window.callPhantom;
-        delete window._phantom;
-        delete window.__nightmare;
-        delete window._seleniumRunner;
-    """)
+    # Stealth patches and resource blocking are independent; register them concurrently
+    await asyncio.gather(
+        context.add_init_script(STEALTH_INIT_SCRIPT),
+        # Skip images, fonts, media, stylesheets and ad/analytics hosts - only the HTML is parsed
+        context.route('**/*', block_heavy_resources),
+    )
 
     return context
 
 
+@functools.lru_cache(maxsize=32)
+def url_origin(url: str) -> str:
+    """Return the scheme://host prefix of a URL (cached; the base is constant per page)."""
+    parsed = urlparse(url)
+    return f'{parsed.scheme}://{parsed.netloc}'
+
+
 def absolute_url(base: str, href: str) -> str:
     """Convert relative URL to absolute."""
     if not href:
         return ''
+    # Fast paths for the two shapes Jooble actually emits; urljoin re-parses both arguments
+    if href.startswith(('https://', 'http://')):
+        return href
+    if href[0] == '/' and href[1:2] != '/' and '/.' not in href:
+        return url_origin(base) + href
     return urljoin(base, href)
 
 
-def select_first_text(container: Tag, selectors: List[str]) -> Optional[str]:
-    """Try multiple selectors and return first non-empty text. Only returns if specifically matched."""
+def tag_text(elem: Tag) -> str:
+    """Same as ``elem.get_text(strip=True)``, in O(1) for the common single-text-node element."""
+    string = elem.string
+    if type(string) is NavigableString:  # Not a Comment/CData subclass, which get_text skips
+        return string.strip()
+    return elem.get_text(strip=True)
+
+
+def element_text(elem: Tag) -> Optional[str]:
+    """Return cleaned text of an element, or None if it carries no meaningful text."""
+    text = tag_text(elem)
+    if text and len(text) > 0:
+        # Clean up common junk
+        text = text.replace('\xa0', ' ').strip()
+        if text and len(text) > 1:
+            return text
+    return None
+
+
+def select_first(container: Tag, selectors: Sequence[Tuple[str, sv.SoupSieve]]) -> Optional[Tag]:
+    """Try multiple compiled selectors and return the first element with meaningful text."""
     if not container:
         return None
     
-    for selector in selectors:
-        try:
-            elem = container.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True)
-                if text and len(text) > 0:
-                    # Clean up common junk
-                    text = text.replace('\xa0', ' ').strip()
-                    if text and len(text) > 1:
-                        return text
-        except Exception:
-            continue
+    # Selectors are validated at import, so only a malformed tree can raise here
+    try:
+        for _css, selector in selectors:
+            elem = selector.select_one(container)
+            if elem and element_text(elem):
+                return elem
+    except AttributeError:
+        pass
     
     return None
 
 
+def select_first_text(container: Tag, selectors: Sequence[Tuple[str, sv.SoupSieve]]) -> Optional[str]:
+    """Try multiple compiled selectors and return first non-empty text. Only returns if specifically matched."""
+    elem = select_first(container, selectors)
+    return element_text(elem) if elem else None
+
+
+def index_link_container(container: Tag) -> Dict[str, Optional[Tag]]:
+    """Walk a link's container once and return the first match of each LINK_FIELD_SELECTORS entry.
+
+    Same result as calling ``select_one`` per field, without re-walking the container.
+    """
+    found: Dict[str, Optional[Tag]] = dict.fromkeys(LINK_FIELD_SELECTORS)
+    remaining = len(found)
+    for tag in container.descendants:
+        if not isinstance(tag, Tag) or not LINK_FIELD_UNION.match(tag):
+            continue
+        for field, selector in LINK_FIELD_SELECTORS.items():
+            if found[field] is None and selector.match(tag):
+                found[field] = tag
+                remaining -= 1
+        if not remaining:
+            break
+    return found
+
+
+def index_block(block: Tag) -> Dict[str, Optional[Tag]]:
+    """Walk a job block once and return the element each field's selectors would pick.
+
+    Equivalent to calling `select_first` per field: for every selector the first
+    match in document order is recorded, then the first one with text wins.
+    """
+    first_matches = {field: [None] * len(selectors) for field, selectors in BLOCK_FIELD_SELECTORS.items()}
+    for tag in block.descendants:
+        if not isinstance(tag, Tag) or not BLOCK_FIELD_UNION.match(tag):
+            continue
+        for field, selectors in BLOCK_FIELD_SELECTORS.items():
+            matches = first_matches[field]
+            for i, (_css, selector) in enumerate(selectors):
+                if matches[i] is None and selector.match(tag):
+                    matches[i] = tag
+
+    return {
+        field: next((elem for elem in matches if elem is not None and element_text(elem)), None)
+        for field, matches in first_matches.items()
+    }
+
+
 def is_internal_detail_url(job_url: Optional[str]) -> bool:
     """Return True if URL stays on Jooble's domain (including redirect endpoints)."""
     if not job_url:
@@ -245,6 +542,23 @@ def is_internal_detail_url(job_url: Optional[str]) -> bool:
     return bool(hostname and 'jooble' in hostname)
 
 
+def job_key(url: str) -> str:
+    """Return a stable dedup key for a job URL, ignoring session-specific query params."""
+    parts = urllib.parse.urlsplit(url)
+    if parts.query and '/redirect' in parts.path:
+        for name, value in urllib.parse.parse_qsl(parts.query):
+            if name in JOB_KEY_PARAMS and value:
+                return f'{parts.netloc}{parts.path}?{name}={value}'
+    elif '/jdp/' in parts.path or '/job/' in parts.path:
+        return f'{parts.netloc}{parts.path}'
+    return url
+
+
+def url_fingerprint(url: str) -> int:
+    """Return a 64-bit fingerprint of a job URL (see `job_key`) for compact cross-page dedup."""
+    return int.from_bytes(hashlib.blake2b(job_key(url).encode('utf-8'), digest_size=8).digest(), 'big')
+
+
 def merge_detail_fields(base_item: Dict[str, Any], detail_data: Dict[str, Any]) -> None:
     """Merge parsed detail data back into the base job item."""
     if not detail_data:
@@ -270,7 +584,7 @@ def parse_detail_page(html: str) -> Dict[str, Optional[str]]:
     detail: Dict[str, Optional[str]] = {}
 
     # JSON-LD often carries the cleanest data - prefer it if present
-    ld_jobs = extract_jobs_from_ld_json(soup)
+    ld_jobs = extract_jobs_from_ld_json(html)
     if ld_jobs:
         ld_job = ld_jobs[0]
         for key in ['job_title', 'company', 'location', 'date_posted', 'job_type', 'salary', 'job_url', 'description_text']:
@@ -279,53 +593,14 @@ def parse_detail_page(html: str) -> Dict[str, Optional[str]]:
                 detail[key] = value
 
     # Description containers on Jooble detail pages
-    description_selectors = [
-        '[data-test-name="job-description"]',
-        '[itemprop="description"]',
-        'div[id*="description" i]',
-        'section[id*="description" i]',
-        'article[id*="description" i]',
-        'div[class*="description" i]',
-    ]
-    for selector in description_selectors:
-        elem = soup.select_one(selector)
+    for _css, selector in DETAIL_DESCRIPTION_SELECTORS:
+        elem = selector.select_one(soup)
         if elem:
             detail['description_html'] = str(elem)
             detail['description_text'] = elem.get_text(' ', strip=True)
             break
 
-    supplemental_fields = {
-        'company': [
-            '[data-test-name="job-company"]',
-            'span[class*="company" i]',
-            'div[class*="company" i]',
-            '[itemprop="hiringOrganization"]',
-        ],
-        'location': [
-            '[data-test-name="job-location"]',
-            'span[class*="location" i]',
-            'div[class*="location" i]',
-            '[itemprop="jobLocation"]',
-        ],
-        'salary': [
-            '[data-test-name="job-salary"]',
-            'span[class*="salary" i]',
-            'div[class*="salary" i]',
-            '[itemprop="baseSalary"]',
-        ],
-        'job_type': [
-            '[data-test-name="job-type"]',
-            'span[class*="employment" i]',
-            'div[class*="employment" i]',
-        ],
-        'date_posted': [
-            '[data-test-name="job-date"]',
-            'time[datetime]',
-            'span[class*="posted" i]',
-        ],
-    }
-
-    for field, selectors in supplemental_fields.items():
+    for field, selectors in DETAIL_FIELD_SELECTORS.items():
         if detail.get(field):
             continue
         value = select_first_text(soup, selectors)
@@ -342,7 +617,7 @@ def parse_detail_page(html: str) -> Dict[str, Optional[str]]:
     return detail
 
 
-async def fetch_job_detail_html(context, job_url: str, referer: Optional[str] = None, label: str = '') -> Optional[str]:
+async def fetch_job_detail_html(context, job_url: str, referer: Optional[str] = None, label: str = '', humanize: bool = True) -> Optional[str]:
     """Fetch a job detail page with Playwright, handling basic anti-bot checks."""
     for attempt in range(1, DETAIL_MAX_ATTEMPTS + 1):
         page: Optional[Page] = None
@@ -363,14 +638,15 @@ async def fetch_job_detail_html(context, job_url: str, referer: Optional[str] =
             if referer:
                 headers['Referer'] = referer
             await page.set_extra_http_headers(headers)
-            await simulate_connection_warmup(page)
+            if humanize:
+                await simulate_connection_warmup(page)
 
-            # Lightweight human-like signals
-            viewport = page.viewport_size or {'width': 1920, 'height': 1080}
-            await page.mouse.move(
-                random.randint(100, viewport['width'] - 100),
-                random.randint(100, viewport['height'] - 100),
-            )
+                # Lightweight human-like signals
+                viewport = page.viewport_size or {'width': 1920, 'height': 1080}
+                await page.mouse.move(
+                    random.randint(100, viewport['width'] - 100),
+                    random.randint(100, viewport['height'] - 100),
+                )
 
             Actor.log.debug(f'[{label}] Detail fetch attempt {attempt}/{DETAIL_MAX_ATTEMPTS}: {job_url}')
             response = await page.goto(job_url, wait_until='domcontentloaded', timeout=DETAIL_FETCH_TIMEOUT)
@@ -411,13 +687,14 @@ async def fetch_job_detail_html(context, job_url: str, referer: Optional[str] =
             except Exception:
                 pass
 
-            # Small scrolls help rendering lazy sections
-            scroll_steps = random.randint(1, 3)
-            for _ in range(scroll_steps):
-                await page.evaluate("window.scrollBy(0, arguments[0]);", random.randint(300, 600))
-                await asyncio.sleep(human_like_delay(0.2, 0.8))
+            if humanize:
+                # Small scrolls help rendering lazy sections
+                scroll_steps = random.randint(1, 3)
+                for _ in range(scroll_steps):
+                    await page.evaluate("(dy) => window.scrollBy(0, dy)", random.randint(300, 600))
+                    await asyncio.sleep(human_like_delay(0.2, 0.8))
 
-            await asyncio.sleep(human_like_delay(0.5, 1.5))
+                await asyncio.sleep(human_like_delay(0.5, 1.5))
             html = await page.content()
             if html:
                 Actor.log.debug(f'[{label}] Detail HTML length {len(html)}')
@@ -438,7 +715,7 @@ async def fetch_job_detail_html(context, job_url: str, referer: Optional[str] =
     return None
 
 
-async def enrich_jobs_with_details(context, job_items: List[Dict[str, Any]], referer: Optional[str] = None) -> List[Dict[str, Any]]:
+async def enrich_jobs_with_details(context, job_items: List[Dict[str, Any]], referer: Optional[str] = None, humanize: bool = True) -> List[Dict[str, Any]]:
     """Fetch and merge detail-page data for each job item."""
     if not job_items or context is None:
         return job_items
@@ -454,7 +731,7 @@ async def enrich_jobs_with_details(context, job_items: List[Dict[str, Any]], ref
                 return
 
             async with semaphore:
-                html = await fetch_job_detail_html(context, job_url, referer=referer, label=f'job#{idx + 1}')
+                html = await fetch_job_detail_html(context, job_url, referer=referer, label=f'job#{idx + 1}', humanize=humanize)
 
             if not html:
                 Actor.log.debug(f'Job detail unavailable for {job_url}')
@@ -479,68 +756,67 @@ async def enrich_jobs_with_details(context, job_items: List[Dict[str, Any]], ref
 
 # --- Job Extraction Functions ---
 
-def extract_jobs_from_ld_json(soup: BeautifulSoup) -> List[Dict[str, Any]]:
-    """Extract jobs from JSON-LD structured data in script tags."""
+def iter_job_postings(data: Any):
+    """Yield the JobPosting objects in a decoded JSON-LD payload (single object or array)."""
+    if isinstance(data, dict):
+        if data.get('@type') == 'JobPosting':
+            yield data
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                yield item
+
+
+def extract_jobs_from_ld_json(html: str) -> List[Dict[str, Any]]:
+    """Extract jobs from JSON-LD structured data in script tags.
+
+    Scans the raw HTML instead of a soup - script bodies are not entity-decoded
+    by the parser, so the regex capture is exactly the script text.
+    """
     jobs = []
     
-    # Find all script tags
-    for script in soup.find_all('script', type='application/ld+json'):
+    # Find all JSON-LD script bodies
+    for match in LD_JSON_SCRIPT_RE.finditer(html):
         try:
-            data = json.loads(script.string)
-            
-            # Handle single JobPosting
-            if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                job = parse_json_ld_job(data)
-                if job:
-                    jobs.append(job)
-            
-            # Handle array of JobPostings
-            elif isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict) and item.get('@type') == 'JobPosting':
-                        job = parse_json_ld_job(item)
-                        if job:
-                            jobs.append(job)
-        except (json.JSONDecodeError, Exception) as e:
+            raw = match.group(1).strip()
+            # WebSite/BreadcrumbList/Organization blocks never hold jobs; skip decoding them
+            if '"JobPosting"' not in raw:
+                continue
+            data = json_loads(raw)
+            jobs.extend(filter(None, map(parse_json_ld_job, iter_job_postings(data))))
+        except (json.JSONDecodeError, Exception) as e:  # orjson's error subclasses json's
             Actor.log.debug(f'Error parsing JSON-LD: {e}')
             continue
     
     return jobs
 
 
+def ld_get(data: Any, *path: str) -> Any:
+    """Follow nested JSON-LD keys, returning None as soon as a level is missing or not an object."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
 def parse_json_ld_job(data: dict) -> Optional[Dict[str, Any]]:
     """Parse a single JobPosting JSON-LD object."""
     try:
         # Extract location
-        location = None
-        if 'jobLocation' in data:
-            loc = data['jobLocation']
-            if isinstance(loc, dict):
-                address = loc.get('address', {})
-                if isinstance(address, dict):
-                    location = address.get('addressLocality') or address.get('addressRegion')
+        address = ld_get(data, 'jobLocation', 'address')
+        location = ld_get(address, 'addressLocality') or ld_get(address, 'addressRegion')
         
         # Extract hiring organization
-        company = None
-        if 'hiringOrganization' in data:
-            org = data['hiringOrganization']
-            if isinstance(org, dict):
-                company = org.get('name')
+        company = ld_get(data, 'hiringOrganization', 'name')
         
         # Extract salary
         salary = None
-        if 'baseSalary' in data:
-            sal = data['baseSalary']
-            if isinstance(sal, dict):
-                value = sal.get('value', {})
-                if isinstance(value, dict):
-                    min_val = value.get('minValue')
-                    max_val = value.get('maxValue')
-                    currency = sal.get('currency')
-                    if min_val and max_val:
-                        salary = f"{min_val}-{max_val} {currency}"
-                    elif min_val:
-                        salary = f"{min_val} {currency}"
+        min_val = ld_get(data, 'baseSalary', 'value', 'minValue')
+        if min_val:
+            max_val = ld_get(data, 'baseSalary', 'value', 'maxValue')
+            currency = data['baseSalary'].get('currency')
+            salary = f"{min_val}-{max_val} {currency}" if max_val else f"{min_val} {currency}"
         
         return {
             'job_title': data.get('title'),
@@ -558,26 +834,26 @@ def parse_json_ld_job(data: dict) -> Optional[Dict[str, Any]]:
         return None
 
 
-def extract_jobs_from_links(soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+def extract_jobs_from_links(soup: BeautifulSoup, page_url: str, candidates: Optional[List[Tag]] = None) -> List[Dict[str, Any]]:
     """Extract jobs by finding job links directly (PRIMARY method - most reliable).
     
     Strategy: Extract ONLY title and URL with high confidence.
     Other fields are left as None unless found in clearly-marked elements.
+    ``candidates`` may carry a pre-selected superset of the link matches (see
+    `PAGE_CANDIDATE_UNION`); otherwise the soup is walked once for all strategies.
     """
+    if candidates is None:
+        candidates = LINK_SELECTOR_UNION.select(soup)
     jobs = []
     seen_urls = set()
+    # Several links (title, company, logo) often share one card; index each card once
+    indexed: Dict[int, Dict[str, Optional[Tag]]] = {}
     
-    # Jooble uses specific link patterns - ordered by reliability
-    link_selectors = [
-        'a[href*="/jdp/"]',       # PRIMARY: Job detail pages
-        'a[href*="/job/"]',       # SECONDARY: Alternate detail pattern
-        'a[href*="/redirect?"]',  # TERTIARY: External redirect (fallback only)
-        'a.job_card_link',        # FALLBACK: CSS class based
-    ]
-    
-    for selector in link_selectors:
+    for css, selector in LINK_SELECTORS:
         found_on_selector = 0
-        for link in soup.select(selector):
+        for link in candidates:
+            if not selector.match(link):
+                continue
             href = link.get('href')
             if not href or len(href) < 5:
                 continue
@@ -588,16 +864,16 @@ def extract_jobs_from_links(soup: BeautifulSoup, page_url: str) -> List[Dict[str
             container = link.find_parent(['div', 'article', 'li', 'tr', 'section'])
 
             # Get title from link text - strip whitespace and validate
-            title = link.get_text(strip=True)
+            title = tag_text(link)
             if (not title or len(title) < 2) and container:
-                title_elem = container.select_one('a[href*="/jdp/"], a[href*="/job/"], h2, h3')
+                title_elem = LINK_TITLE_SELECTOR.select_one(container)
                 if title_elem:
-                    title = title_elem.get_text(strip=True)
+                    title = tag_text(title_elem)
             if not title or len(title) < 2:
                 continue
             
             # Skip navigation links
-            if any(x in title.lower() for x in ['next', 'prev', 'all jobs', 'home', 'about']):
+            if NAV_TITLE_RE.search(title):
                 continue
             
             # Initialize metadata fields - we'll try to extract but be conservative
@@ -611,59 +887,64 @@ def extract_jobs_from_links(soup: BeautifulSoup, page_url: str) -> List[Dict[str
             job_url = abs_url
 
             if container:
+                fields = indexed.get(id(container))
+                if fields is None:
+                    fields = indexed[id(container)] = index_link_container(container)
+
                 # Prefer detail page URL if present within the container
-                detail_link = container.select_one('a[href*="/jdp/"], a[href*="/job/"]')
+                detail_link = fields['detail_link']
                 if detail_link and detail_link.get('href'):
                     job_url = absolute_url(page_url, detail_link.get('href'))
 
                 # Extract metadata ONLY from clearly-marked elements
                 
                 # Company: Only from elements with "company" in class name
-                company_elem = container.select_one('span[class*="company" i], div[class*="company" i], span[class*="employer" i], div[class*="employer" i]')
+                company_elem = fields['company']
                 if company_elem:
-                    company = company_elem.get_text(strip=True)
+                    company = tag_text(company_elem)
                     if company and len(company) > 100:
                         company = None  # Probably not a company name if too long
                 
                 # Location: Only from elements with "location" in class
-                location_elem = container.select_one('span[class*="location" i], div[class*="location" i], span[class*="city" i], div[class*="city" i]')
+                location_elem = fields['location']
                 if location_elem:
-                    location = location_elem.get_text(strip=True)
+                    location = tag_text(location_elem)
                     if location and len(location) > 100:
                         location = None  # Too long
                 
                 # Salary: Only from elements with "salary" in class
-                salary_elem = container.select_one('span[class*="salary" i], div[class*="salary" i], span[class*="wage" i], div[class*="wage" i]')
+                salary_elem = fields['salary']
                 if salary_elem:
-                    salary = salary_elem.get_text(strip=True)
+                    salary = tag_text(salary_elem)
                     # Only keep if it has a currency symbol (reliability check)
                     if salary and not any(c in salary for c in ['$', '£', '€', '¥']):
                         salary = None
                 
                 # Date Posted: Only from time elements or date-specific classes
-                date_elem = container.select_one('time, span[class*="posted" i], span[class*="date" i], div[class*="date" i]')
+                date_elem = fields['date_posted']
                 if date_elem:
-                    date_posted = date_elem.get_text(strip=True)
+                    date_posted = tag_text(date_elem)
                     if date_posted and len(date_posted) > 100:
                         date_posted = None
                 
                 # Job Type: Only from employment-type-specific elements
-                type_elem = container.select_one('span[class*="type" i], span[class*="employment" i], span[class*="schedule" i]')
+                type_elem = fields['job_type']
                 if type_elem:
-                    job_type = type_elem.get_text(strip=True)
+                    job_type = tag_text(type_elem)
                     if job_type and len(job_type) > 50:
                         job_type = None
                 
                 # Description: Look for description-specific elements (p, div with description class)
-                desc_elem = container.select_one('p[class*="description" i], div[class*="description" i], div[class*="snippet" i], div[class*="summary" i]')
+                desc_elem = fields['description']
                 if desc_elem:
-                    description_text = desc_elem.get_text(strip=True)
+                    description_text = tag_text(desc_elem)
                     if description_text and len(description_text) > 500:
                         description_text = description_text[:500]  # Truncate if too long
             canonical_job_url = job_url or abs_url
-            if canonical_job_url in seen_urls:
+            key = job_key(canonical_job_url)
+            if key in seen_urls:
                 continue
-            seen_urls.add(canonical_job_url)
+            seen_urls.add(key)
             
             jobs.append({
                 'job_title': title,
@@ -680,41 +961,45 @@ def extract_jobs_from_links(soup: BeautifulSoup, page_url: str) -> List[Dict[str
         
         # If we found jobs with this selector, don't try others
         if found_on_selector > 0:
-            Actor.log.debug(f'Link selector "{selector}" found {found_on_selector} jobs')
+            Actor.log.debug(f'Link selector "{css}" found {found_on_selector} jobs')
             break
     
     return jobs
 
 
-def extract_job_blocks(page_soup: BeautifulSoup) -> List[Tag]:
-    """Extract job listing blocks from Jooble search page."""
+def extract_job_blocks(page_soup: BeautifulSoup, candidates: Optional[List[Tag]] = None) -> List[Tag]:
+    """Extract job listing blocks from Jooble search page (``candidates`` as in `extract_jobs_from_links`)."""
     blocks = []
     
-    # Jooble-specific selectors based on actual site structure
-    selectors = [
-        'article',  # Most common container
-        'div[class*="_75cac"]',  # Jooble class pattern
-        'div[data-test-name="job-item"]',
-        'div.job-item',
-    ]
+    if candidates is None:
+        try:
+            candidates = BLOCK_SELECTOR_UNION.select(page_soup)
+        except Exception as e:
+            Actor.log.debug(f'Block selector union failed: {e}')
+            return blocks
+    if not candidates:
+        return blocks
+    
+    # Job-link check per candidate, computed once even when several strategies match it
+    verified: Dict[int, bool] = {}
     
-    for selector in selectors:
+    for css, selector in BLOCK_SELECTORS:
         try:
-            found = page_soup.select(selector)
-            if found:
-                for elem in found:
+            for elem in candidates:
+                if not selector.match(elem):
+                    continue
+                key = id(elem)
+                if key not in verified:
                     # Verify it has a job link
-                    link = elem.find('a', href=True)
-                    if link:
-                        href = link.get('href', '')
-                        if any(pattern in href for pattern in ['/redirect', '/job/', '/jdp/']):
-                            blocks.append(elem)
-                
-                if blocks:
-                    Actor.log.debug(f'Selector "{selector}" found {len(blocks)} job blocks')
-                    break
+                    verified[key] = JOB_LINK_SELECTOR.select_one(elem) is not None
+                if verified[key]:
+                    blocks.append(elem)
+            
+            if blocks:
+                Actor.log.debug(f'Selector "{css}" found {len(blocks)} job blocks')
+                break
         except Exception as e:
-            Actor.log.debug(f'Selector "{selector}" failed: {e}')
+            Actor.log.debug(f'Selector "{css}" failed: {e}')
             continue
     
     return blocks
@@ -728,61 +1013,28 @@ def parse_job_block(block: Tag, page_url: str) -> Optional[Dict[str, Any]]:
         if not link:
             return None
         
-        detail_link = block.select_one('a[href*="/jdp/"], a[href*="/job/"]')
+        detail_link = DETAIL_LINK_SELECTOR.select_one(block)
         href = (detail_link.get('href') if detail_link and detail_link.get('href') else link.get('href'))
-        if not href or not any(p in href for p in ['/redirect', '/job/', '/jdp/']):
+        if not href or not JOB_HREF_RE.search(href):
             return None
         
         job_url = absolute_url(page_url, href)
-        job_title = link.get_text(strip=True)
+        job_title = tag_text(link)
         
         if not job_title:
             return None
         
-        # Extract company - look for common patterns
-        company = select_first_text(block, [
-            'span[class*="company" i]',
-            'div[class*="company" i]',
-            'a[class*="company" i]',
-            '[data-company]',
-        ])
-        
-        # Extract location
-        location = select_first_text(block, [
-            'span[class*="location" i]',
-            'div[class*="location" i]',
-            '[class*="city" i]',
-            '[data-location]',
-        ])
-        
-        # Extract salary
-        salary = select_first_text(block, [
-            'span[class*="salary" i]',
-            'div[class*="salary" i]',
-            '[class*="wage" i]',
-            '[data-salary]',
-        ])
-        
-        # Extract description snippet
-        description_text = select_first_text(block, [
-            'div[class*="description" i]',
-            'div[class*="snippet" i]',
-            'p[class*="description" i]',
-        ])
-        
-        # Extract date posted
-        date_posted = select_first_text(block, [
-            'span[class*="date" i]',
-            'time',
-            '[datetime]',
-        ])
+        # Locate company, location, salary, description, date and job type in one walk
+        fields = index_block(block)
+        company, location, salary, date_posted, job_type = (
+            element_text(fields[name]) if fields[name] else None
+            for name in ('company', 'location', 'salary', 'date_posted', 'job_type')
+        )
         
-        # Extract job type
-        job_type = select_first_text(block, [
-            'span[class*="type" i]',
-            'span[class*="schedule" i]',
-            '[data-type]',
-        ])
+        # Description snippet - text and HTML come from the same Tag
+        description_elem = fields['description']
+        description_text = element_text(description_elem) if description_elem else None
+        description_html = str(description_elem) if description_elem else None
         
         return {
             'job_title': job_title,
@@ -792,7 +1044,7 @@ def parse_job_block(block: Tag, page_url: str) -> Optional[Dict[str, Any]]:
             'job_type': job_type,
             'job_url': job_url,
             'description_text': description_text,
-            'description_html': None,
+            'description_html': description_html,
             'salary': salary,
         }
     except Exception as e:
@@ -800,11 +1052,136 @@ def parse_job_block(block: Tag, page_url: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-async def fetch_search_page(page: Page, url: str, referer: Optional[str] = None, page_num: Optional[int] = None) -> Optional[str]:
+def parse_search_page(html: str, url: str, page_num: int, seen_hashes: Set[int], limit: int = 0) -> List[Dict[str, Any]]:
+    """Parse a search results page into new job items (priority: links -> blocks -> JSON-LD).
+
+    Runs in a worker thread, so ``seen_hashes`` (see `url_fingerprint`) is only read
+    here; the caller records the URLs of the returned items. A positive ``limit``
+    (the remaining maxJobs budget) stops extraction once that many items are found.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    # One walk serves both the link and the block extractors
+    candidates = PAGE_CANDIDATE_UNION.select(soup)
+    page_items: List[Dict[str, Any]] = []
+    page_seen: Set[int] = set()
+
+    def full() -> bool:
+        return limit > 0 and len(page_items) >= limit
+
+    def add_items(items) -> None:
+        for item in items:
+            if full():
+                return
+            if not item:
+                continue
+            job_url = item.get('job_url')
+            fingerprint = url_fingerprint(job_url) if job_url else None
+            if fingerprint is not None and (fingerprint in seen_hashes or fingerprint in page_seen):
+                continue
+            item['source_url'] = url
+            item['page_number'] = page_num
+            page_items.append(item)
+            if fingerprint is not None:
+                page_seen.add(fingerprint)
+
+    # PRIMARY: Direct link extraction (most reliable on Jooble)
+    try:
+        Actor.log.info('Attempting direct link extraction (PRIMARY method)...')
+        link_jobs = extract_jobs_from_links(soup, page_url=url, candidates=candidates)
+        Actor.log.info(f'Direct link extraction found {len(link_jobs)} jobs')
+        add_items(link_jobs)
+    except Exception as e:
+        Actor.log.debug(f'Error in direct link extraction: {e}')
+
+    # SECONDARY: Try job blocks if links didn't work well
+    if len(page_items) < 5 and not full():
+        try:
+            Actor.log.debug('Direct links insufficient, trying job blocks (SECONDARY)...')
+            blocks = extract_job_blocks(soup, candidates=candidates)
+            if blocks:
+                Actor.log.debug(f'Found {len(blocks)} job blocks')
+                add_items(parse_job_block(block, page_url=url) for block in blocks)
+        except Exception as e:
+            Actor.log.debug(f'Error in job block extraction: {e}')
+
+    # TERTIARY: Try JSON-LD if very few jobs found
+    if len(page_items) < 3 and not full():
+        try:
+            Actor.log.debug('Jobs still low, trying JSON-LD extraction (TERTIARY)...')
+            ld_jobs = extract_jobs_from_ld_json(html)
+            if ld_jobs:
+                Actor.log.debug(f'JSON-LD found {len(ld_jobs)} jobs')
+                add_items(ld_jobs)
+        except Exception as e:
+            Actor.log.debug(f'Error in JSON-LD extraction: {e}')
+
+    return page_items
+
+
+async def fetch_search_page_http(context, url: str, user_agent: str, referer: Optional[str] = None) -> Optional[str]:
+    """Fetch a search page over plain HTTP via the context's request client.
+
+    The request shares cookies with the browser context but skips rendering
+    entirely. ``user_agent`` must be the one those cookies were issued to, since
+    Cloudflare binds clearance to it. Returns None unless the response is a 200
+    whose HTML already contains job cards, so callers can fall back to
+    `fetch_search_page`.
+    """
+    headers = {
+        'User-Agent': user_agent,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        **get_client_hints_for_ua(user_agent),
+    }
+    if referer:
+        headers['Referer'] = referer
+
+    try:
+        response = await context.request.get(url, headers=headers, timeout=HTTP_FETCH_TIMEOUT)
+        if response.status != 200:
+            Actor.log.debug(f'HTTP fetch status {response.status} for {url}')
+            return None
+        html = await response.text()
+    except Exception as e:
+        Actor.log.debug(f'HTTP fetch failed for {url}: {e}')
+        return None
+
+    if not LISTING_MARKER_RE.search(html):
+        Actor.log.debug(f'HTTP fetch for {url} has no server-rendered job cards')
+        return None
+    return html
+
+
+# Diagnostic uploads still in flight; awaited by `flush_background_saves` before exit
+_pending_saves: Set[asyncio.Task] = set()
+
+
+def _on_save_done(task: asyncio.Task) -> None:
+    _pending_saves.discard(task)
+    if not task.cancelled() and task.exception():
+        Actor.log.debug(f'Failed to save diagnostics: {task.exception()}')
+
+
+def save_value_in_background(key: str, value: Any, content_type: str) -> None:
+    """Upload a diagnostic record to the key-value store without blocking the caller."""
+    task = asyncio.create_task(Actor.set_value(key, value, content_type=content_type))
+    _pending_saves.add(task)
+    task.add_done_callback(_on_save_done)
+
+
+async def flush_background_saves() -> None:
+    """Wait for every pending diagnostic upload."""
+    if _pending_saves:
+        await asyncio.gather(*_pending_saves, return_exceptions=True)
+
+
+async def fetch_search_page(page: Page, url: str, referer: Optional[str] = None, page_num: Optional[int] = None, humanize: bool = True) -> Tuple[Optional[str], str]:
     """Fetch the HTML content of a search page using Playwright with retries and diagnostics.
 
     This function handles Cloudflare challenges, retries with exponential backoff,
-    rotates user-agents, and saves diagnostics on final failure.
+    rotates user-agents, and saves diagnostics on final failure. With ``humanize``
+    off, the synthetic delays, warmup and mouse/scroll simulation are skipped.
+    Returns the HTML (None on failure) and the User-Agent sent on the last attempt.
     """
     max_attempts = MAX_RETRY_ATTEMPTS
     base_delay = BASE_RETRY_DELAY
@@ -822,23 +1199,19 @@ async def fetch_search_page(page: Page, url: str, referer: Optional[str] = None,
             headers['Referer'] = referer
 
         try:
-            # Human-like delay before attempt with jitter
-            delay = human_like_delay(1.0, 4.0) * attempt  # Increase delay with attempts
-            await asyncio.sleep(delay)
+            if humanize:
+                # Human-like delay before attempt with jitter
+                delay = human_like_delay(1.0, 4.0) * attempt  # Increase delay with attempts
+                await asyncio.sleep(delay)
 
             await page.set_extra_http_headers(headers)
 
-            # Simulate connection warmup before navigation
-            await simulate_connection_warmup(page)
+            if humanize:
+                # Simulate connection warmup before navigation
+                await simulate_connection_warmup(page)
 
             Actor.log.info(f'Attempt {attempt}/{max_attempts} fetching {url} with UA: {ua[:60]}')
-            
-            # Disable request interception to avoid blocking resources
-            try:
-                await page.route('**/*', lambda route: route.continue_())
-            except Exception:
-                pass
-            
+
             response = await page.goto(url, wait_until='domcontentloaded', timeout=40000)
 
             if not response:
@@ -871,14 +1244,23 @@ async def fetch_search_page(page: Page, url: str, referer: Optional[str] = None,
                             )
                             Actor.log.info('Challenge resolved, checking page content...')
                             
-                            # Check if we got past the challenge
-                            new_response = await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                            if new_response and new_response.status == 200:
+                            # A solved challenge reloads the target itself; only re-navigate if it
+                            # did not land on real listings (a block or error page has no widget either)
+                            await page.wait_for_load_state('domcontentloaded')
+                            still_challenged = 'challenge' in page.url.lower() or await page.query_selector(
+                                '[data-sitekey], #challenge-form, .cf-challenge'
+                            )
+                            if not still_challenged and LISTING_MARKER_RE.search(await page.content()):
                                 Actor.log.info('Successfully bypassed challenge!')
                                 status = 200
                             else:
-                                Actor.log.warning(f'After challenge: status {new_response.status if new_response else "none"}')
-                                raise RuntimeError('Challenge passed but still blocked')
+                                new_response = await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                                if new_response and new_response.status == 200:
+                                    Actor.log.info('Successfully bypassed challenge!')
+                                    status = 200
+                                else:
+                                    Actor.log.warning(f'After challenge: status {new_response.status if new_response else "none"}')
+                                    raise RuntimeError('Challenge passed but still blocked')
                         except Exception as e:
                             Actor.log.warning(f'Challenge wait timed out or failed: {e}')
                             raise
@@ -891,9 +1273,9 @@ async def fetch_search_page(page: Page, url: str, referer: Optional[str] = None,
                         try:
                             key = f'fail_screenshot_page_{page_num or "na"}_attempt_{attempt}.png'
                             screenshot = await page.screenshot(full_page=False)
-                            await Actor.set_value(key, screenshot, content_type='image/png')
+                            save_value_in_background(key, screenshot, content_type='image/png')
                             html_snip = await page.content()
-                            await Actor.set_value(f'fail_html_page_{page_num or "na"}_attempt_{attempt}.html', html_snip[:10000], content_type='text/html')
+                            save_value_in_background(f'fail_html_page_{page_num or "na"}_attempt_{attempt}.html', html_snip[:10000], content_type='text/html')
                         except Exception as e:
                             Actor.log.debug(f'Failed to save diagnostics: {e}')
                     
@@ -914,53 +1296,60 @@ async def fetch_search_page(page: Page, url: str, referer: Optional[str] = None,
                 if attempt == max_attempts:
                     # Save diagnostics
                     try:
-                        await Actor.set_value(f'fail_status_page_{page_num or "na"}', str(status), content_type='text/plain')
+                        save_value_in_background(f'fail_status_page_{page_num or "na"}', str(status), content_type='text/plain')
                         html_snip = await page.content()
-                        await Actor.set_value(f'fail_html_page_{page_num or "na"}_attempt_{attempt}.html', html_snip[:10000], content_type='text/html')
+                        save_value_in_background(f'fail_html_page_{page_num or "na"}_attempt_{attempt}.html', html_snip[:10000], content_type='text/html')
                     except Exception as e:
                         Actor.log.debug(f'Failed to save error snapshot: {e}')
-                    return None
+                    return None, ua
                 # Backoff for other errors
                 backoff_delay = exponential_backoff_with_jitter(attempt, base_delay, max_delay=20)
                 await asyncio.sleep(backoff_delay)
                 continue
 
             # Wait for job listing elements (best-effort)
+            listings_ready = False
             try:
-                await page.wait_for_selector('article, a[href*="/redirect"], div[class*="job"]', timeout=10000)
+                # 'attached' resolves as soon as the server-rendered cards are in the DOM (no layout wait)
+                await page.wait_for_selector(
+                    'article, a[href*="/redirect"], div[class*="job"]', state='attached', timeout=LISTING_WAIT_TIMEOUT
+                )
+                listings_ready = True
             except Exception as e:
                 Actor.log.debug(f'Wait for selector timed out: {e}')
 
-            # Simulate human-like browsing behavior
-            try:
-                # Random mouse movement
-                viewport = page.viewport_size or {'width': 1920, 'height': 1080}
-                mouse_x = random.randint(200, viewport['width'] - 200)
-                mouse_y = random.randint(200, viewport['height'] - 200)
-                await page.mouse.move(mouse_x, mouse_y)
+            if humanize:
+                # Simulate human-like browsing behavior
+                try:
+                    # Random mouse movement
+                    viewport = page.viewport_size or {'width': 1920, 'height': 1080}
+                    mouse_x = random.randint(200, viewport['width'] - 200)
+                    mouse_y = random.randint(200, viewport['height'] - 200)
+                    await page.mouse.move(mouse_x, mouse_y)
 
-                # Simulate reading time before scrolling
-                await asyncio.sleep(human_like_delay(1.0, 3.0))
+                    # Simulate reading time before scrolling
+                    await asyncio.sleep(human_like_delay(1.0, 3.0))
 
-                # Natural scrolling pattern (reduced)
-                scroll_steps = random.randint(1, 3)
-                for i in range(scroll_steps):
-                    scroll_amount = random.randint(200, 400)
-                    await page.evaluate(f"window.scrollBy(0, {scroll_amount});")
-                    await asyncio.sleep(human_like_delay(0.3, 1.0))
+                    # Natural scrolling pattern (reduced)
+                    scroll_steps = random.randint(1, 3)
+                    for i in range(scroll_steps):
+                        scroll_amount = random.randint(200, 400)
+                        await page.evaluate(f"window.scrollBy(0, {scroll_amount});")
+                        await asyncio.sleep(human_like_delay(0.3, 1.0))
 
-                # Simulate reading time
-                await asyncio.sleep(human_like_delay(0.5, 2.0))
+                    # Simulate reading time
+                    await asyncio.sleep(human_like_delay(0.5, 2.0))
 
-            except Exception as e:
-                Actor.log.debug(f'Error during browsing simulation: {e}')
+                except Exception as e:
+                    Actor.log.debug(f'Error during browsing simulation: {e}')
 
-            # Final small delay
-            await asyncio.sleep(human_like_delay(0.5, 1.5))
+            # Final small delay, only needed while listings may still be rendering
+            if not listings_ready:
+                await asyncio.sleep(human_like_delay(0.5, 1.5))
 
             html = await page.content()
             Actor.log.info(f'Successfully fetched {url} (len={len(html)}) on attempt {attempt}')
-            return html
+            return html, ua
 
         except Exception as e:
             Actor.log.warning(f'Attempt {attempt} failed for {url}: {e}')
@@ -969,17 +1358,17 @@ async def fetch_search_page(page: Page, url: str, referer: Optional[str] = None,
                 try:
                     key = f'exception_screenshot_page_{page_num or "na"}_attempt_{attempt}.png'
                     screenshot = await page.screenshot(full_page=False)
-                    await Actor.set_value(key, screenshot, content_type='image/png')
+                    save_value_in_background(key, screenshot, content_type='image/png')
                     html_snip = await page.content()
-                    await Actor.set_value(f'exception_html_page_{page_num or "na"}_attempt_{attempt}.html', html_snip[:15000], content_type='text/html')
+                    save_value_in_background(f'exception_html_page_{page_num or "na"}_attempt_{attempt}.html', html_snip[:15000], content_type='text/html')
                 except Exception as e2:
                     Actor.log.debug(f'Failed to save final diagnostics: {e2}')
-                return None
+                return None, ua
             # Exponential backoff before retrying with jitter
             backoff_delay = exponential_backoff_with_jitter(attempt, base_delay, max_delay=15)
             await asyncio.sleep(backoff_delay)
     
-    return None
+    return None, ua
 
 
 async def main() -> None:
@@ -993,6 +1382,14 @@ async def main() -> None:
         max_pages: int = int(actor_input.get('max_pages') or DEFAULT_MAX_PAGES)
         start_url: Optional[str] = (actor_input.get('startUrl') or '').strip() or None
         max_jobs: int = int(actor_input.get('maxJobs') or DEFAULT_MAX_JOBS)
+        # Number of search pages fetched concurrently, each on its own tab
+        page_concurrency: int = max(1, int(actor_input.get('maxConcurrency') or DEFAULT_PAGE_CONCURRENCY))
+        # Try server-rendered HTML over plain HTTP before a full browser navigation
+        http_fetch: bool = bool(actor_input.get('useHttpFetch', True))
+        # Synthetic delays, warmup and mouse/scroll simulation; off trades stealth for throughput
+        humanize: bool = bool(actor_input.get('humanize', True))
+        # Per-response and console logging is opt-in; it fires for every subresource
+        debug_network: bool = bool(actor_input.get('debugNetwork', False))
         
         # Get proxy configuration
         proxy_config = actor_input.get('proxyConfiguration')
@@ -1020,25 +1417,29 @@ async def main() -> None:
             Actor.log.info('Provide either "startUrl" or "keyword" (ukw). Exiting...')
             await Actor.exit()
 
-        def page_url(page_number: int) -> str:
-            # If startUrl provided, preserve its query params and just update p
-            if start_url:
-                parsed = urllib.parse.urlparse(start_url)
-                q = urllib.parse.parse_qs(parsed.query, keep_blank_values=True)
-                q['p'] = [str(page_number)]
-                new_query = urllib.parse.urlencode({k: v[0] if isinstance(v, list) else v for k, v in q.items()})
-                return urllib.parse.urlunparse((parsed.scheme, parsed.netloc, parsed.path, '', new_query, ''))
-            # Build URL with optional region. Jooble accepts empty rgns.
-            params = {
-                'ukw': keyword,
-                'p': str(page_number),
+        # Build the search URL prefix once; only the `p` parameter changes per page
+        if start_url:
+            # If startUrl provided, preserve its query params and just update p (moved to the end)
+            start_parsed = urllib.parse.urlparse(start_url)
+            search_params = {
+                k: v[0] for k, v in urllib.parse.parse_qs(start_parsed.query, keep_blank_values=True).items() if k != 'p'
             }
+            search_base = urllib.parse.urlunparse((start_parsed.scheme, start_parsed.netloc, start_parsed.path, '', '', ''))
+        else:
+            # Build URL with optional region. Jooble accepts empty rgns.
+            search_params = {'ukw': keyword}
             # Do NOT send empty rgns to avoid anti-bot heuristics; omit when not provided
             if region:
-                params['rgns'] = region
-            return 'https://jooble.org/SearchResult?' + urllib.parse.urlencode(params)
+                search_params['rgns'] = region
+            search_base = 'https://jooble.org/SearchResult'
+        search_query = urllib.parse.urlencode(search_params)
+        search_prefix = f'{search_base}?{search_query}&p=' if search_query else f'{search_base}?p='
 
-        seen_urls: Set[str] = set()
+        def page_url(page_number: int) -> str:
+            return search_prefix + str(page_number)
+
+        seen_hashes: Set[int] = set()  # 64-bit job URL fingerprints
+        parsed_pages: Set[bytes] = set()  # Digests of search page HTML already parsed
         total_pushed = 0
         referer_url: Optional[str] = None
 
@@ -1053,14 +1454,14 @@ async def main() -> None:
                     '--disable-setuid-sandbox',
                     '--disable-dev-shm-usage',
                     '--no-first-run',
-                    '--no-zygote',
-                    '--disable-web-security',
                     '--disable-blink-features=AutomationControlled',
                     # Removed overly aggressive flags:
                     # - disable-gpu (can trigger bot detection)
                     # - disable-accelerated-2d-canvas (looks like bot)
                     # - disable-extensions (unnecessary, raises suspicion)
                     # - hide-scrollbars (obvious bot behavior)
+                    # - no-zygote (renderers can't fork from a shared zygote; more RAM per context)
+                    # - disable-web-security (not needed to read same-origin HTML)
                     # Keep minimal flags to blend in
                 ]
             }
@@ -1104,45 +1505,73 @@ async def main() -> None:
             
             browser = await p.chromium.launch(**launch_options)
             
-            # Create initial browser context with stealth and realistic settings
-            context = await create_stealth_context(browser)
-            page = await context.new_page()
-
-            # Network and console event handlers for debugging connectivity
-            def _on_request_failed(request):
-                try:
-                    Actor.log.warning(f'Request failed: {request.url} - {getattr(request, "failure", None)}')
-                except Exception:
-                    pass
-
-            def _on_console(msg):
-                try:
-                    Actor.log.debug(f'Console [{msg.type}]: {msg.text}')
-                except Exception:
-                    pass
-
-            def _on_response(response):
-                try:
-                    Actor.log.debug(f'Response: {response.url} -> {response.status}')
-                except Exception:
-                    pass
+            async def open_page(ctx) -> Page:
+                """Open a tab in ``ctx`` with debug handlers and browser-like headers attached."""
+                new_page = await ctx.new_page()
+                attach_debug_handlers(new_page, verbose=debug_network)
+                await new_page.set_extra_http_headers(BROWSER_NAV_HEADERS)
+                return new_page
+
+            async def open_worker() -> Tuple[Any, Page]:
+                """Create an isolated stealth context with one configured tab."""
+                ctx = await create_stealth_context(browser)
+                return ctx, await open_page(ctx)
+
+            async def open_workers() -> List[Tuple[Any, Page]]:
+                """Create one context per concurrent search-page fetch, each with its own fingerprint."""
+                return list(await asyncio.gather(*[open_worker() for _ in range(page_concurrency)]))
+
+            async def close_workers() -> None:
+                for ctx, _ in workers:
+                    warm_contexts.pop(ctx, None)
+                await asyncio.gather(*[ctx.close() for ctx, _ in workers], return_exceptions=True)
+
+            http_misses = 0  # Consecutive plain HTTP fetches without job listings
+
+            def record_http_miss(ctx) -> None:
+                """Re-warm ``ctx`` through the browser; give up on plain HTTP after repeated misses."""
+                nonlocal http_fetch, http_misses
+                warm_contexts.pop(ctx, None)
+                http_misses += 1
+                if http_fetch and http_misses >= HTTP_FETCH_MAX_MISSES:
+                    Actor.log.info(
+                        f'Plain HTTP fetch returned no job listings {http_misses} times in a row, '
+                        'using the browser for search pages'
+                    )
+                    http_fetch = False
+
+            async def fetch_one(worker: Tuple[Any, Page], page_num: int) -> Tuple[int, str, Optional[str], Optional[str], Any]:
+                """Fetch a single search page in its own context; returns that context for detail fetches."""
+                nonlocal http_misses
+                worker_ctx, worker_page = worker
+                url = page_url(page_num)
+                Actor.log.info(f'Scraping search page {page_num}: {url}')
+
+                # Generate realistic referer
+                referer = generate_realistic_referer(page_num, page_url(page_num - 1))
+
+                html = None
+                # Plain HTTP only once this context has cookies from a browser navigation
+                if http_fetch and worker_ctx in warm_contexts:
+                    html = await fetch_search_page_http(worker_ctx, url, warm_contexts[worker_ctx], referer=referer)
+                    if html:
+                        http_misses = 0
+                        Actor.log.info(f'Fetched search page {page_num} over plain HTTP (len={len(html)})')
+                    else:
+                        # One miss may be a transient timeout or 429; only this context falls back
+                        record_http_miss(worker_ctx)
+                if not html:
+                    html, nav_ua = await fetch_search_page(worker_page, url, referer=referer, page_num=page_num, humanize=humanize)
+                    if html:
+                        warm_contexts[worker_ctx] = nav_ua
+                return page_num, url, referer, html, worker_ctx
 
-            page.on('requestfailed', _on_request_failed)
-            page.on('console', _on_console)
-            page.on('response', _on_response)
+            # Contexts whose cookies came from a successful browser fetch of a search page,
+            # mapped to the User-Agent that fetch sent
+            warm_contexts: Dict[Any, str] = {}
 
-            # Set additional headers to mimic real browser (remove DNT as it's a bot signature)
-            await page.set_extra_http_headers({
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0',
-            })
+            # Create initial browser contexts with stealth and realistic settings
+            workers = await open_workers()
 
             # Skip health checks or make them truly non-blocking
             # Health checks can trigger bot detection and waste time
@@ -1155,193 +1584,116 @@ async def main() -> None:
                 
                 session_page_count = 0
                 max_pages_per_session = random.randint(3, 8)  # Rotate session every 3-8 pages
+                next_workers: Optional[asyncio.Task] = None  # Next session's contexts, built ahead of rotation
                 
-                for page_num in range(1, max_pages + 1):
+                # Fetch up to `page_concurrency` pages at once, then process them in page order
+                for window_start in range(1, max_pages + 1, page_concurrency):
                     # Rotate session if needed
                     if session_page_count >= max_pages_per_session:
                         Actor.log.info(f'Rotating session after {session_page_count} pages')
-                        await context.close()
-                        context = await create_stealth_context(browser)
-                        page = await context.new_page()
-                        # Re-attach event handlers
-                        page.on('requestfailed', _on_request_failed)
-                        page.on('console', _on_console)
-                        page.on('response', _on_response)
-                        # Re-set headers
-                        await page.set_extra_http_headers({
-                            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                            'Accept-Language': 'en-US,en;q=0.9',
-                            'Accept-Encoding': 'gzip, deflate, br',
-                            'Upgrade-Insecure-Requests': '1',
-                            'Sec-Fetch-Dest': 'document',
-                            'Sec-Fetch-Mode': 'navigate',
-                            'Sec-Fetch-Site': 'none',
-                            'Sec-Fetch-User': '?1',
-                            'Cache-Control': 'max-age=0',
-                        })
+                        await close_workers()
+                        workers = await (next_workers or open_workers())
+                        next_workers = None
                         session_page_count = 0
                         max_pages_per_session = random.randint(3, 8)
-                        # Clear cookies and local storage
-                        await context.clear_cookies()
-                        await page.evaluate("localStorage.clear(); sessionStorage.clear();")
                     
-                    url = page_url(page_num)
-                    Actor.log.info(f'Scraping search page {page_num}: {url}')
-
-                    # Generate realistic referer
-                    referer = generate_realistic_referer(url, page_num)
+                    window = range(window_start, min(window_start + page_concurrency, max_pages + 1))
+                    fetched = await asyncio.gather(*[
+                        fetch_one(worker, page_num) for worker, page_num in zip(workers, window)
+                    ])
+                    window_fetched_at = asyncio.get_running_loop().time()
+
+                    for page_num, url, referer, html, context in fetched:
+                        if all(context is not ctx for ctx, _ in workers):
+                            # Contexts were replaced mid-window by the proxy fallback below
+                            context = workers[0][0]
+                        referer_url = url  # Update for next iteration
+                        
+                        # If fetch failed and proxy is active, try without proxy
+                        if not html and proxy_configured:
+                            Actor.log.info(f'Fetch failed with proxy on page {page_num}, attempting without proxy...')
+                            try:
+                                await close_workers()
+                                workers = await open_workers()
+                                context = workers[0][0]
+                                proxy_configured = False
+                                Actor.log.info('Switched to direct connection (no proxy)')
+                                # Retry fetch without proxy
+                                html, _ = await fetch_search_page(workers[0][1], url, referer=referer, page_num=page_num, humanize=humanize)
+                            except Exception as e:
+                                Actor.log.error(f'Failed to switch to non-proxy context: {e}')
+                        
+                        if not html:
+                            Actor.log.warning(f'Failed to fetch HTML for {url} (all attempts), skipping page...')
+                            continue  # Continue to next page instead of breaking
 
-                    html = await fetch_search_page(page, url, referer=referer, page_num=page_num)
-                    referer_url = url  # Update for next iteration
-                    
-                    # If fetch failed and proxy is active, try without proxy
-                    if not html and proxy_configured:
-                        Actor.log.info(f'Fetch failed with proxy on page {page_num}, attempting without proxy...')
-                        try:
-                            await context.close()
-                            context = await create_stealth_context(browser)
-                            page = await context.new_page()
-                            page.on('requestfailed', _on_request_failed)
-                            page.on('console', _on_console)
-                            page.on('response', _on_response)
-                            await page.set_extra_http_headers({
-                                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                                'Accept-Language': 'en-US,en;q=0.9',
-                                'Accept-Encoding': 'gzip, deflate, br',
-                                'Upgrade-Insecure-Requests': '1',
-                                'Sec-Fetch-Dest': 'document',
-                                'Sec-Fetch-Mode': 'navigate',
-                                'Sec-Fetch-Site': 'none',
-                                'Sec-Fetch-User': '?1',
-                                'Cache-Control': 'max-age=0',
-                            })
-                            proxy_configured = False
-                            Actor.log.info('Switched to direct connection (no proxy)')
-                            # Retry fetch without proxy
-                            html = await fetch_search_page(page, url, referer=referer, page_num=page_num)
-                        except Exception as e:
-                            Actor.log.error(f'Failed to switch to non-proxy context: {e}')
-                    
-                    if not html:
-                        Actor.log.warning(f'Failed to fetch HTML for {url} (all attempts), skipping page...')
-                        continue  # Continue to next page instead of breaking
+                        session_page_count += 1
 
-                    soup = BeautifulSoup(html, 'lxml')
-                    session_page_count += 1
+                        # Out-of-range page numbers serve the last page again; it holds nothing new
+                        page_digest = hashlib.blake2b(html.encode('utf-8'), digest_size=16).digest()
+                        if page_digest in parsed_pages:
+                            Actor.log.info(f'Page {page_num} is identical to an already parsed page, skipping parse')
+                            continue
+                        parsed_pages.add(page_digest)
 
-                    # Extract jobs using optimized approach (priority: links -> blocks -> JSON-LD)
-                    try:
-                        extracted_count = 0
-                        page_items: List[Dict[str, Any]] = []
-                        
-                        # PRIMARY: Direct link extraction (most reliable on Jooble)
                         try:
-                            Actor.log.info('Attempting direct link extraction (PRIMARY method)...')
-                            link_jobs = extract_jobs_from_links(soup, page_url=url)
-                            Actor.log.info(f'Direct link extraction found {len(link_jobs)} jobs')
-                            
-                            for item in link_jobs:
-                                job_url = item.get('job_url')
-                                if job_url and job_url in seen_urls:
-                                    continue
-                                
-                                item['source_url'] = url
-                                item['page_number'] = page_num
-                                page_items.append(item)
-                                extracted_count += 1
-                                if job_url:
-                                    seen_urls.add(job_url)
-                        except Exception as e:
-                            Actor.log.debug(f'Error in direct link extraction: {e}')
+                            # Parse off the event loop; lxml releases the GIL while building the tree
+                            # Only the remaining maxJobs budget is parsed and enriched
+                            remaining = max_jobs - total_pushed if max_jobs > 0 else 0
+                            page_items = await asyncio.to_thread(parse_search_page, html, url, page_num, seen_hashes, remaining)
+                            seen_hashes.update(url_fingerprint(item['job_url']) for item in page_items if item.get('job_url'))
 
-                        # SECONDARY: Try job blocks if links didn't work well
-                        if extracted_count < 5:
-                            try:
-                                Actor.log.debug('Direct links insufficient, trying job blocks (SECONDARY)...')
-                                blocks = extract_job_blocks(soup)
-                                if blocks:
-                                    Actor.log.debug(f'Found {len(blocks)} job blocks')
-                                    for block in blocks:
-                                        try:
-                                            item = parse_job_block(block, page_url=url)
-                                            if not item:
-                                                continue
-                                            job_url = item.get('job_url')
-                                            if job_url and job_url in seen_urls:
-                                                continue
-
-                                            item['source_url'] = url
-                                            item['page_number'] = page_num
-                                            page_items.append(item)
-                                            extracted_count += 1
-                                            if job_url:
-                                                seen_urls.add(job_url)
-                                        except Exception as e:
-                                            Actor.log.debug(f'Error parsing job block: {e}')
-                                            continue
-                            except Exception as e:
-                                Actor.log.debug(f'Error in job block extraction: {e}')
+                            if not page_items:
+                                Actor.log.info('No jobs found on this page, continuing to next page...')
+                                continue
 
-                        # TERTIARY: Try JSON-LD if very few jobs found
-                        if extracted_count < 3:
                             try:
-                                Actor.log.debug('Jobs still low, trying JSON-LD extraction (TERTIARY)...')
-                                ld_jobs = extract_jobs_from_ld_json(soup)
-                                if ld_jobs:
-                                    Actor.log.debug(f'JSON-LD found {len(ld_jobs)} jobs')
-                                    for item in ld_jobs:
-                                        job_url = item.get('job_url')
-                                        if job_url and job_url in seen_urls:
-                                            continue
-                                        item['source_url'] = url
-                                        item['page_number'] = page_num
-                                        page_items.append(item)
-                                        extracted_count += 1
-                                        if job_url:
-                                            seen_urls.add(job_url)
+                                enriched_items = await enrich_jobs_with_details(context, page_items, referer=url, humanize=humanize)
                             except Exception as e:
-                                Actor.log.debug(f'Error in JSON-LD extraction: {e}')
+                                Actor.log.debug(f'Detail enrichment failed, pushing raw items: {e}')
+                                enriched_items = page_items
 
-                        if not page_items:
-                            Actor.log.info('No jobs found on this page, continuing to next page...')
-                            continue
+                            # One dataset write per page, trimmed to the remaining maxJobs budget
+                            if max_jobs > 0:
+                                enriched_items = enriched_items[:max_jobs - total_pushed]
+                            if enriched_items:
+                                await Actor.push_data(enriched_items)
+                            pushed_this_page = len(enriched_items)
+                            total_pushed += pushed_this_page
+
+                            Actor.log.info(f'Page {page_num}: pushed {pushed_this_page} new items (total {total_pushed}).')
 
-                        try:
-                            enriched_items = await enrich_jobs_with_details(context, page_items, referer=url)
-                        except Exception as e:
-                            Actor.log.debug(f'Detail enrichment failed, pushing raw items: {e}')
-                            enriched_items = page_items
-
-                        pushed_this_page = 0
-                        for item in enriched_items:
-                            await Actor.push_data(item)
-                            total_pushed += 1
-                            pushed_this_page += 1
                             if max_jobs > 0 and total_pushed >= max_jobs:
+                                Actor.log.info(f'Reached maxJobs limit ({max_jobs}). Stopping.')
                                 break
 
-                        Actor.log.info(f'Page {page_num}: pushed {pushed_this_page} new items (total {total_pushed}).')
+                        except Exception as e:
+                            Actor.log.warning(f'Error processing page {page_num}: {e}')
+                            continue  # Continue to next page
 
                         if max_jobs > 0 and total_pushed >= max_jobs:
                             Actor.log.info(f'Reached maxJobs limit ({max_jobs}). Stopping.')
                             break
 
-                    except Exception as e:
-                        Actor.log.warning(f'Error processing page {page_num}: {e}')
-                        continue  # Continue to next page
-
                     if max_jobs > 0 and total_pushed >= max_jobs:
-                        Actor.log.info(f'Reached maxJobs limit ({max_jobs}). Stopping.')
                         break
 
-                    # Add pacing between pages to avoid rate limiting
-                    if page_num < max_pages:
-                        page_delay = human_like_delay(3.0, 8.0)  # 3-8 seconds between pages
-                        Actor.log.debug(f'Pacing: waiting {page_delay:.1f}s before next page')
-                        await asyncio.sleep(page_delay)
+                    # Add pacing between page windows to avoid rate limiting
+                    if window[-1] < max_pages:
+                        if session_page_count >= max_pages_per_session and next_workers is None:
+                            # Rotation is due; build the fresh contexts during the pacing sleep
+                            next_workers = asyncio.create_task(open_workers())
+                        # 3-8 seconds between search fetches; parsing and detail enrichment count toward it
+                        page_delay = human_like_delay(3.0, 8.0) - (asyncio.get_running_loop().time() - window_fetched_at)
+                        if page_delay > 0:
+                            Actor.log.debug(f'Pacing: waiting {page_delay:.1f}s before next pages')
+                            await asyncio.sleep(page_delay)
 
             finally:
+                if next_workers is not None:
+                    next_workers.cancel()
                 await browser.close()
+                await flush_background_saves()
 
         Actor.log.info(f'Scrape complete. Total items: {total_pushed}.')
 